@@ -1,187 +1,333 @@
 import bpy
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 import tempfile
 import traceback
+import copy
 import os
+import random
 import shutil
+import time
+from collections import OrderedDict
 from contextlib import suppress
 
+# Optional HTTP/2 client for the FAL queue API (falls back to requests)
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+    httpx = None
+
 # Constants defined locally to avoid circular imports
 RODIN_FREE_TRIAL_KEY = "k9TcfFoEhNd9cCPP2guHAHHHkctZHIRhZDywZ1euGUXwihbYLpOjQhofby80NJez"
 
+# Retry policy for transient provider errors (overridable via environment variables)
+RETRY_BASE = float(os.getenv("BLENDERMCP_HYPER3D_RETRY_BASE", "1.0"))
+RETRY_CAP = float(os.getenv("BLENDERMCP_HYPER3D_RETRY_CAP", "30.0"))
+RETRY_JITTER = float(os.getenv("BLENDERMCP_HYPER3D_RETRY_JITTER", "0.5"))
+RETRY_MAX = int(os.getenv("BLENDERMCP_HYPER3D_RETRIES", "3"))
+# Total time a request may take across attempts and waits; each attempt is also bounded by
+# REQUEST_TIMEOUT and the remaining budget, keeping calls below the MCP server's 15 s socket timeout
+RETRY_BUDGET = float(os.getenv("BLENDERMCP_HYPER3D_RETRY_BUDGET", "10.0"))
+REQUEST_TIMEOUT = float(os.getenv("BLENDERMCP_HYPER3D_TIMEOUT", "10.0"))
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+# Statuses that mean the request was not processed, so even a POST can be resent
+UNPROCESSED_STATUS = frozenset({429, 503})
+
+# Poll results are shared between callers for this long (seconds)
+POLL_CACHE_TTL = 0.75
+POLL_CACHE_SIZE = 64
+TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED", "Done", "Failed"})
+
 class Hyper3DHandlers:
     """Handlers for Hyper3D Rodin integration"""
 
+    def __init__(self):
+        # Shared session so keep-alive reuses TLS connections across poll/download cycles
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("https://", adapter)
+        if HAS_HTTPX:
+            try:
+                self._http2 = httpx.Client(
+                    http2=True,
+                    timeout=30.0,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=8),
+                )
+            except ImportError:
+                pass  # http2 extra (h2) not installed
+        # (mode, job key) -> (monotonic timestamp, poll result)
+        self._poll_cache = OrderedDict()
+
+        # Per-mode dispatch tables
+        self._job_creators = {
+            "MAIN_SITE": self._create_rodin_job_main_site,
+            "FAL_AI": self._create_rodin_job_fal_ai,
+        }
+        self._status_fetchers = {
+            "MAIN_SITE": self._fetch_rodin_job_status_main_site,
+            "FAL_AI": self._fetch_rodin_job_status_fal_ai,
+        }
+        self._importers = {
+            "MAIN_SITE": self.import_generated_asset_main_site,
+            "FAL_AI": self.import_generated_asset_fal_ai,
+        }
+
+    def _request_with_backoff(self, method, url, idempotent=True, **kwargs):
+        """
+        Send a request, retrying throttling/server errors with exponential backoff and jitter.
+        Non-idempotent requests are only retried when the server cannot have processed them
+        (429/503 or a failed connection). A Retry-After longer than the remaining RETRY_BUDGET
+        returns the response immediately instead of retrying early.
+        """
+        retry_status = RETRYABLE_STATUS if idempotent else UNPROCESSED_STATUS
+        timeout = kwargs.pop("timeout", REQUEST_TIMEOUT)
+        deadline = time.monotonic() + RETRY_BUDGET
+        attempt = 0
+        while True:
+            error = response = None
+            attempt_timeout = min(timeout, max(deadline - time.monotonic(), 1.0))
+            try:
+                response = self._session.request(method, url, timeout=attempt_timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= RETRY_MAX or not (idempotent or self._is_connect_error(e)):
+                    raise
+                error = e
+                retry_after = 0
+            else:
+                if response.status_code not in retry_status or attempt >= RETRY_MAX:
+                    return response
+                try:
+                    retry_after = int(response.headers.get("Retry-After", 0))
+                except ValueError:
+                    retry_after = 0
+
+            delay = min(RETRY_BASE * 2 ** attempt, RETRY_CAP) * (1 + random.uniform(0, RETRY_JITTER))
+            delay = max(delay, retry_after)
+            if time.monotonic() + delay > deadline:
+                # Waiting as long as asked would exceed the budget: report the last outcome
+                # instead of blocking Blender or retrying before the server allows it
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _is_connect_error(error):
+        """Whether a request failed before reaching the server (safe to resend)"""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
     def create_rodin_job(self, text_prompt=None, images=None, bbox_condition=None):
         """Create a new Hyper3D Rodin generation job"""
         try:
             # Determine the mode based on API key
-            api_key = bpy.context.scene.blendermcp_hyper3d_api_key
-            mode = bpy.context.scene.blendermcp_hyper3d_mode
-
-            if mode == "MAIN_SITE":
-                # Use the main site API
-                url = "https://hyperhuman.deemos.com/api/v2/generate"
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                }
-
-                # Prepare the payload
-                payload = {
-                    "text": text_prompt,
-                    "bbox_condition": bbox_condition,
-                }
-
-                if images:
-                    # For images, we need to handle them differently
-                    # This is a simplified version - the full implementation would handle image uploads
-                    payload["images"] = images
-
-                response = requests.post(url, headers=headers, json=payload)
-
-            elif mode == "FAL_AI":
-                # Use FAL AI API
-                url = "https://queue.fal.run/fal-ai/hyper3d/"
-                headers = {
-                    "Authorization": f"Key {api_key}",
-                    "Content-Type": "application/json"
-                }
-
-                # Prepare the payload for FAL AI
-                payload = {
-                    "text_prompt": text_prompt,
-                    "bbox_condition": bbox_condition,
-                }
-
-                if images:
-                    payload["input_image_url"] = images[0] if isinstance(images, list) else images
-
-                response = requests.post(url, headers=headers, json=payload)
-            else:
-                return {"error": f"Unknown Hyper3D mode: {mode}"}
+            scn = bpy.context.scene
+            api_key = scn.blendermcp_hyper3d_api_key
+            mode = scn.blendermcp_hyper3d_mode
 
-            if response.status_code == 200:
-                data = response.json()
-
-                if mode == "MAIN_SITE":
-                    # Extract job information
-                    job_id = data.get("job_id")
-                    if not job_id:
-                        return {"error": "No job_id returned from Hyper3D API"}
-
-                    return {
-                        "uuid": job_id,
-                        "jobs": {
-                            "subscription_key": job_id,  # For MAIN_SITE, use job_id as subscription_key
-                        },
-                        "submit_time": True
-                    }
-
-                elif mode == "FAL_AI":
-                    # Extract request ID for FAL AI
-                    request_id = data.get("request_id")
-                    if not request_id:
-                        return {"error": "No request_id returned from FAL AI"}
-
-                    return {
-                        "uuid": request_id,  # Use request_id as uuid for consistency
-                        "jobs": {
-                            "subscription_key": request_id,  # For FAL_AI, use request_id as subscription_key
-                        },
-                        "submit_time": True
-                    }
-            else:
-                return {"error": f"API request failed with status code {response.status_code}: {response.text}"}
+            create = self._job_creators.get(mode)
+            if create is None:
+                return {"error": f"Unknown Hyper3D mode: {mode}"}
+            return create(api_key, text_prompt, images, bbox_condition)
 
         except Exception as e:
             return {"error": f"Failed to create Rodin job: {str(e)}"}
 
+    def _create_rodin_job_main_site(self, api_key, text_prompt, images, bbox_condition):
+        """Submit a generation job to the main site API"""
+        url = "https://hyperhuman.deemos.com/api/v2/generate"
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+        }
+
+        # Prepare the payload
+        payload = {
+            "text": text_prompt,
+            "bbox_condition": bbox_condition,
+        }
+
+        if images:
+            # For images, we need to handle them differently
+            # This is a simplified version - the full implementation would handle image uploads
+            payload["images"] = images
+
+        response = self._request_with_backoff("POST", url, idempotent=False, headers=headers, json=payload)
+        if response.status_code != 200:
+            return {"error": f"API request failed with status code {response.status_code}: {response.text}"}
+
+        # Extract job information
+        job_id = response.json().get("job_id")
+        if not job_id:
+            return {"error": "No job_id returned from Hyper3D API"}
+
+        return {
+            "uuid": job_id,
+            "jobs": {
+                "subscription_key": job_id,  # For MAIN_SITE, use job_id as subscription_key
+            },
+            "submit_time": True
+        }
+
+    def _create_rodin_job_fal_ai(self, api_key, text_prompt, images, bbox_condition):
+        """Submit a generation job to the FAL AI API"""
+        url = "https://queue.fal.run/fal-ai/hyper3d/"
+        headers = {
+            "Authorization": f"Key {api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Prepare the payload for FAL AI
+        payload = {
+            "text_prompt": text_prompt,
+            "bbox_condition": bbox_condition,
+        }
+
+        if images:
+            payload["input_image_url"] = images[0] if isinstance(images, list) else images
+
+        response = self._request_with_backoff("POST", url, idempotent=False, headers=headers, json=payload)
+        if response.status_code != 200:
+            return {"error": f"API request failed with status code {response.status_code}: {response.text}"}
+
+        # Extract request ID for FAL AI
+        request_id = response.json().get("request_id")
+        if not request_id:
+            return {"error": "No request_id returned from FAL AI"}
+
+        return {
+            "uuid": request_id,  # Use request_id as uuid for consistency
+            "jobs": {
+                "subscription_key": request_id,  # For FAL_AI, use request_id as subscription_key
+            },
+            "submit_time": True
+        }
+
     def poll_rodin_job_status(self, subscription_key=None, request_id=None):
         """Poll the status of a Hyper3D Rodin job"""
         try:
-            mode = bpy.context.scene.blendermcp_hyper3d_mode
-            api_key = bpy.context.scene.blendermcp_hyper3d_api_key
-
-            if mode == "MAIN_SITE":
-                if not subscription_key:
-                    return {"error": "subscription_key is required for MAIN_SITE mode"}
-
-                url = f"https://hyperhuman.deemos.com/api/v2/jobs/{subscription_key}"
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                }
-
-                response = requests.get(url, headers=headers)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    status = data.get("status", "unknown")
-
-                    # Return status information
-                    return {
-                        "status": status,
-                        "progress": data.get("progress", 0),
-                        "message": data.get("message", ""),
-                        "data": data
-                    }
-                else:
-                    return {"error": f"Failed to get job status: {response.status_code}"}
-
-            elif mode == "FAL_AI":
-                if not request_id:
-                    return {"error": "request_id is required for FAL_AI mode"}
-
-                url = f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}"
-                headers = {
-                    "Authorization": f"Key {api_key}",
-                }
+            scn = bpy.context.scene
+            mode = scn.blendermcp_hyper3d_mode
+            api_key = scn.blendermcp_hyper3d_api_key
+        except Exception as e:
+            return {"error": f"Failed to poll job status: {str(e)}"}
 
-                response = requests.get(url, headers=headers)
+        key = (mode, subscription_key or request_id)
+        now = time.monotonic()
+        cached = self._poll_cache.get(key)
+        if cached is not None and now - cached[0] < POLL_CACHE_TTL:
+            self._poll_cache.move_to_end(key)
+            # Each caller gets its own copy so mutations can't leak between pollers
+            return copy.deepcopy(cached[1])
 
-                if response.status_code == 200:
-                    data = response.json()
-                    status = data.get("status", "unknown")
+        result = self._fetch_rodin_job_status(mode, api_key, subscription_key, request_id)
 
-                    # Return status information
-                    return {
-                        "status": status,
-                        "message": data.get("message", ""),
-                        "data": data
-                    }
-                else:
-                    return {"error": f"Failed to get request status: {response.status_code}"}
-            else:
+        if "error" in result or result.get("status") in TERMINAL_STATUSES:
+            # Terminal or failed polls always go back to the provider next time
+            self._poll_cache.pop(key, None)
+        else:
+            self._poll_cache[key] = (now, copy.deepcopy(result))
+            self._poll_cache.move_to_end(key)
+            while len(self._poll_cache) > POLL_CACHE_SIZE:
+                self._poll_cache.popitem(last=False)
+        return result
+
+    def _fetch_rodin_job_status(self, mode, api_key, subscription_key=None, request_id=None):
+        """Fetch the status of a Hyper3D Rodin job from the provider"""
+        try:
+            fetch = self._status_fetchers.get(mode)
+            if fetch is None:
                 return {"error": f"Unknown Hyper3D mode: {mode}"}
+            return fetch(api_key, subscription_key, request_id)
 
         except Exception as e:
             return {"error": f"Failed to poll job status: {str(e)}"}
 
+    def _fetch_rodin_job_status_main_site(self, api_key, subscription_key, request_id):
+        """Fetch job status from the main site API"""
+        if not subscription_key:
+            return {"error": "subscription_key is required for MAIN_SITE mode"}
+
+        url = f"https://hyperhuman.deemos.com/api/v2/jobs/{subscription_key}"
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+        }
+
+        response = self._request_with_backoff("GET", url, headers=headers)
+        if response.status_code != 200:
+            return {"error": f"Failed to get job status: {response.status_code}"}
+
+        data = response.json()
+
+        # Return status information
+        return {
+            "status": data.get("status", "unknown"),
+            "progress": data.get("progress", 0),
+            "message": data.get("message", ""),
+            "data": data
+        }
+
+    def _fetch_rodin_job_status_fal_ai(self, api_key, subscription_key, request_id):
+        """Fetch request status from the FAL AI API"""
+        if not request_id:
+            return {"error": "request_id is required for FAL_AI mode"}
+
+        url = f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}"
+        headers = {
+            "Authorization": f"Key {api_key}",
+        }
+
+        response = self._request_with_backoff("GET", url, headers=headers)
+        if response.status_code != 200:
+            return {"error": f"Failed to get request status: {response.status_code}"}
+
+        data = response.json()
+
+        # Return status information
+        return {
+            "status": data.get("status", "unknown"),
+            "message": data.get("message", ""),
+            "data": data
+        }
+
     def _clean_imported_glb(self, filepath, mesh_name=None):
         """Clean up imported GLB/GLTF and return the mesh object"""
-        # Get all objects before import
-        existing_objects = set(bpy.data.objects)
-
-        # Import the GLB/GLTF file
-        if filepath.endswith('.glb'):
-            bpy.ops.import_scene.gltf(filepath=filepath)
-        elif filepath.endswith('.gltf'):
-            bpy.ops.import_scene.gltf(filepath=filepath)
-        else:
+        if not filepath.endswith(('.glb', '.gltf')):
             raise ValueError("Unsupported file format")
 
-        # Ensure the context is updated
-        bpy.context.view_layer.update()
+        # The glTF importer selects what it creates, so start from an empty selection
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        previous_active = bpy.context.view_layer.objects.active
+
+        # Import the GLB/GLTF file
+        bpy.ops.import_scene.gltf(filepath=filepath)
 
         # Get all imported objects
-        imported_objects = list(set(bpy.data.objects) - existing_objects)
-        # imported_objects = [obj for obj in bpy.context.view_layer.objects if obj.select_get()]
+        imported_objects = list(bpy.context.selected_objects)
+        if not imported_objects:
+            # Fall back to the newly activated root and its hierarchy
+            active = bpy.context.view_layer.objects.active
+            if active is not None and active != previous_active:
+                imported_objects = [active, *active.children_recursive]
 
         if not imported_objects:
             print("Error: No objects were imported.")
             return
 
-        # Identify the mesh object
+        # Identify the mesh object, collecting reparent/remove work to apply in one batch
         mesh_obj = None
+        to_reparent = []
+        to_remove = []
 
         if len(imported_objects) == 1 and imported_objects[0].type == 'MESH':
             mesh_obj = imported_objects[0]
@@ -198,13 +344,9 @@ class Hyper3DHandlers:
                     if potential_mesh.type == 'MESH':
                         print("GLB structure confirmed: Empty node with one mesh child.")
 
-                        # Unparent the mesh from the empty node
-                        potential_mesh.parent = None
-
-                        # Remove the empty node
-                        bpy.data.objects.remove(parent_obj)
-                        print("Removed empty node, keeping only the mesh.")
-
+                        # Unparent the mesh and drop the empty node
+                        to_reparent.append(potential_mesh)
+                        to_remove.append(parent_obj)
                         mesh_obj = potential_mesh
                     else:
                         print("Error: Child is not a mesh object.")
@@ -216,6 +358,12 @@ class Hyper3DHandlers:
                 print("Error: Expected an empty node with one mesh child or a single mesh object.")
                 return
 
+        for obj in to_reparent:
+            obj.parent = None
+        if to_remove:
+            bpy.data.batch_remove(ids=to_remove)
+            print("Removed empty node, keeping only the mesh.")
+
         # Rename the mesh if needed
         try:
             if mesh_obj and mesh_obj.name is not None and mesh_name:
@@ -229,61 +377,41 @@ class Hyper3DHandlers:
         return mesh_obj
 
     def import_generated_asset(self, *args, **kwargs):
-        match bpy.context.scene.blendermcp_hyper3d_mode:
-            case "MAIN_SITE":
-                return self.import_generated_asset_main_site(*args, **kwargs)
-            case "FAL_AI":
-                return self.import_generated_asset_fal_ai(*args, **kwargs)
-            case _:
-                return f"Error: Unknown Hyper3D Rodin mode!"
+        mode = bpy.context.scene.blendermcp_hyper3d_mode
+        importer = self._importers.get(mode, self._unknown_mode)
+        return importer(*args, **kwargs)
 
-    def import_generated_asset_main_site(self, task_uuid: str, name: str):
-        """Fetch the generated asset, import into blender"""
-        response = requests.post(
-            "https://hyperhuman.deemos.com/api/v2/download",
-            headers={
-                "Authorization": f"Bearer {bpy.context.scene.blendermcp_hyper3d_api_key}",
-            },
-            json={
-                'task_uuid': task_uuid
-            }
-        )
-        data_ = response.json()
-        temp_file = None
-        for i in data_["list"]:
-            if i["name"].endswith(".glb"):
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False,
-                    prefix=task_uuid,
-                    suffix=".glb",
-                )
-
-                try:
-                    # Download the content
-                    response = requests.get(i["url"], stream=True)
-                    response.raise_for_status()  # Raise an exception for HTTP errors
-
-                    # Write the content to the temporary file
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)
-
-                    # Close the file
-                    temp_file.close()
-
-                except Exception as e:
-                    # Clean up the file if there's an error
-                    temp_file.close()
-                    os.unlink(temp_file.name)
-                    return {"succeed": False, "error": str(e)}
+    @staticmethod
+    def _unknown_mode(*args, **kwargs):
+        return f"Error: Unknown Hyper3D Rodin mode!"
+
+    def _download_to_file(self, url, temp_file, use_http2=False):
+        """Stream url into an open temp file and close it"""
+        if use_http2 and hasattr(self, "_http2"):
+            with temp_file, self._http2.stream("GET", url) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes(1024 * 1024):
+                    temp_file.write(chunk)
+            return
+        with temp_file, self._session.get(url, stream=True) as response:
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            # Copy in the C layer with a 1 MiB buffer instead of a Python chunk loop
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, temp_file, length=1024 * 1024)
 
-                break
-        else:
-            return {"succeed": False, "error": "Generation failed. Please first make sure that all jobs of the task are done and then try again later."}
+    def _download_and_import_glb(self, url, uuid_for_prefix, mesh_name, use_http2=False):
+        """Download a GLB into a temp file, import it and describe the resulting object"""
+        temp_file = tempfile.NamedTemporaryFile(
+            delete=False,
+            prefix=uuid_for_prefix,
+            suffix=".glb",
+        )
 
         try:
+            self._download_to_file(url, temp_file, use_http2)
             obj = self._clean_imported_glb(
                 filepath=temp_file.name,
-                mesh_name=name
+                mesh_name=mesh_name
             )
             result = {
                 "name": obj.name,
@@ -302,64 +430,42 @@ class Hyper3DHandlers:
             }
         except Exception as e:
             return {"succeed": False, "error": str(e)}
+        finally:
+            # Always remove the download; imported data lives in bpy.data, not the file
+            temp_file.close()
+            with suppress(FileNotFoundError, OSError):
+                os.unlink(temp_file.name)
 
-    def import_generated_asset_fal_ai(self, request_id: str, name: str):
+    def import_generated_asset_main_site(self, task_uuid: str, name: str):
         """Fetch the generated asset, import into blender"""
-        response = requests.get(
-            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}",
+        api_key = bpy.context.scene.blendermcp_hyper3d_api_key
+        response = self._session.post(
+            "https://hyperhuman.deemos.com/api/v2/download",
             headers={
-                "Authorization": f"Key {bpy.context.scene.blendermcp_hyper3d_api_key}",
+                "Authorization": f"Bearer {api_key}",
+            },
+            json={
+                'task_uuid': task_uuid
             }
         )
         data_ = response.json()
-        temp_file = None
-
-        temp_file = tempfile.NamedTemporaryFile(
-            delete=False,
-            prefix=request_id,
-            suffix=".glb",
-        )
-
-        try:
-            # Download the content
-            response = requests.get(data_["model_mesh"]["url"], stream=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-
-            # Write the content to the temporary file
-            for chunk in response.iter_content(chunk_size=8192):
-                temp_file.write(chunk)
-
-            # Close the file
-            temp_file.close()
-
-        except Exception as e:
-            # Clean up the file if there's an error
-            temp_file.close()
-            os.unlink(temp_file.name)
-            return {"succeed": False, "error": str(e)}
-
-        try:
-            obj = self._clean_imported_glb(
-                filepath=temp_file.name,
-                mesh_name=name
-            )
-            result = {
-                "name": obj.name,
-                "type": obj.type,
-                "location": [obj.location.x, obj.location.y, obj.location.z],
-                "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-            }
-
-            if obj.type == "MESH":
-                bounding_box = self._get_aabb(obj)
-                result["world_bounding_box"] = bounding_box
+        for i in data_["list"]:
+            if i["name"].endswith(".glb"):
+                return self._download_and_import_glb(i["url"], task_uuid, name)
+        return {"succeed": False, "error": "Generation failed. Please first make sure that all jobs of the task are done and then try again later."}
 
-            return {
-                "succeed": True, **result
+    def import_generated_asset_fal_ai(self, request_id: str, name: str):
+        """Fetch the generated asset, import into blender"""
+        api_key = bpy.context.scene.blendermcp_hyper3d_api_key
+        client = getattr(self, "_http2", self._session)
+        response = client.get(
+            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}",
+            headers={
+                "Authorization": f"Key {api_key}",
             }
-        except Exception as e:
-            return {"succeed": False, "error": str(e)}
+        )
+        data_ = response.json()
+        return self._download_and_import_glb(data_["model_mesh"]["url"], request_id, name, use_http2=True)
 
     @staticmethod
     def _get_aabb(obj):
@@ -367,24 +473,27 @@ class Hyper3DHandlers:
         if obj.type != 'MESH':
             raise TypeError("Object must be a mesh")
 
-        # Get the bounding box corners in local space
-        local_bbox_corners = [mathutils.Vector(corner) for corner in obj.bound_box]
+        # Evaluate the depsgraph so matrix_world reflects any reparenting done after import
+        bpy.context.view_layer.update()
 
-        # Convert to world coordinates
-        world_bbox_corners = [obj.matrix_world @ corner for corner in local_bbox_corners]
+        # Local-space bounding box corners as homogeneous column vectors (4x8)
+        corners = np.empty((4, 8))
+        corners[:3] = np.asarray(obj.bound_box).T
+        corners[3] = 1.0
 
-        # Compute axis-aligned min/max coordinates
-        min_corner = mathutils.Vector(map(min, zip(*world_bbox_corners)))
-        max_corner = mathutils.Vector(map(max, zip(*world_bbox_corners)))
+        # Convert all corners to world coordinates with a single matmul
+        world = np.array(obj.matrix_world) @ corners
 
+        # Compute axis-aligned min/max coordinates
         return [
-            [*min_corner], [*max_corner]
+            world[:3].min(axis=1).tolist(), world[:3].max(axis=1).tolist()
         ]
 
     def get_hyper3d_status(self):
         """Get the current status of Hyper3D Rodin integration"""
-        enabled = bpy.context.scene.blendermcp_use_hyper3d
-        api_key = bpy.context.scene.blendermcp_hyper3d_api_key
+        scn = bpy.context.scene
+        enabled = scn.blendermcp_use_hyper3d
+        api_key = scn.blendermcp_hyper3d_api_key
 
         if enabled and api_key:
             return {"enabled": True, "message": "Hyper3D Rodin integration is enabled and ready to use."}
@@ -3,10 +3,15 @@ Plugin Loader for Blender MCP
 Dynamically loads MCP tools from plugins directory.
 """
 
-import os
+import sys
+import types
 import importlib.util
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from .template_engine import _iter_suffix
+
+# Plugins are registered in sys.modules under this prefix so they can't shadow real modules
+PLUGIN_NAMESPACE = "blender_mcp_plugins"
 
 class PluginLoader:
     """
@@ -17,22 +22,55 @@ class PluginLoader:
     def __init__(self, plugin_dir: str = "plugins"):
         self.dir = Path(plugin_dir)
         self.dir.mkdir(exist_ok=True)
+        # Loaded plugins keyed by path, so unchanged files are not re-executed
+        self._loaded: Dict[Path, Tuple[float, types.ModuleType]] = {}
+
+    def _namespace(self) -> types.ModuleType:
+        """Get the plugin namespace package, registering it and this plugin directory on first use."""
+        package = sys.modules.get(PLUGIN_NAMESPACE)
+        if package is None:
+            package = types.ModuleType(PLUGIN_NAMESPACE)
+            package.__path__ = []
+            sys.modules[PLUGIN_NAMESPACE] = package
+        path = str(self.dir.resolve())
+        if path not in package.__path__:
+            package.__path__.append(path)
+        return package
 
     def load_all(self, mcp_instance=None):
         """
-        Load all plugins from the plugin directory.
+        Load all plugins from the plugin directory, in name order.
         If mcp_instance is provided, plugins can access it for tool registration.
+        Plugins whose mtime is unchanged since the last call are skipped.
+        Plugins can import each other as blender_mcp_plugins.<name>.
         """
-        for file in self.dir.glob("*.py"):
-            if file.stem.startswith("__"):
+        package = self._namespace()
+        # Same scan as the template directory: regular files only, symlinks are not followed
+        for entry in sorted(_iter_suffix(self.dir, ".py"), key=lambda e: e.name):
+            if entry.name.startswith("__"):
                 continue
+            file = Path(entry.path)
+            module_name = f"{PLUGIN_NAMESPACE}.{file.stem}"
+            previous = sys.modules.get(module_name)
             try:
-                spec = importlib.util.spec_from_file_location(file.stem, file)
+                mtime = entry.stat().st_mtime
+                if self._loaded.get(file, (None,))[0] == mtime:
+                    continue
+                spec = importlib.util.spec_from_file_location(module_name, file)
                 module = importlib.util.module_from_spec(spec)
                 # Make mcp instance available to plugins if needed
                 if mcp_instance:
                     module.mcp = mcp_instance
+                # Registered before executing, as the import system does (needed by e.g. dataclasses)
+                sys.modules[module_name] = module
                 spec.loader.exec_module(module)
+                setattr(package, file.stem, module)
+                self._loaded[file] = (mtime, module)
                 print(f"Loaded plugin: {file.name}")
             except Exception as e:
-                print(f"Failed loading plugin {file.name}: {e}")
\ No newline at end of file
+                # Keep the previously loaded version, if any
+                if previous is not None:
+                    sys.modules[module_name] = previous
+                else:
+                    sys.modules.pop(module_name, None)
+                print(f"Failed loading plugin {file.name}: {e}")
@@ -4,11 +4,18 @@ Provides reusable templates for Blender operations with versioning, analytics, a
 """
 
 import os
+import sys
 import json
 import time
+import atexit
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 from datetime import datetime
 
 # Optional Git support
@@ -19,8 +26,58 @@ except ImportError:
     HAS_GIT = False
     git = None
 
+# Optional fast JSON support (falls back to the stdlib json module)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 logger = logging.getLogger("BlenderMCP.TemplateEngine")
 
+def _intern_template(data: Any) -> Any:
+    """Intern tag and tool-name strings so lookups compare by identity."""
+    if data.__class__ is not dict:
+        return data
+    tags = data.get("tags")
+    if tags.__class__ is list:
+        data["tags"] = [sys.intern(t) if t.__class__ is str else t for t in tags]
+    actions = data.get("actions")
+    if actions.__class__ is list:
+        for step in actions:
+            if step.__class__ is dict and step.get("tool").__class__ is str:
+                step["tool"] = sys.intern(step["tool"])
+    return data
+
+
+def _iter_suffix(d: Path, suffix: str):
+    """Yield os.DirEntry objects for regular files in d ending with suffix."""
+    with os.scandir(d) as it:
+        for e in it:
+            if e.is_file(follow_symlinks=False) and e.name.endswith(suffix):
+                yield e
+
+
+STATS_FLUSH_INTERVAL = 2.0  # seconds
+USAGE_FLUSH_EVENTS = 100  # flush immediately once this many usage events are buffered
+MERGE_CACHE_SIZE = 128
+
+
 class TemplateManager:
     """
     Manages Blender operation templates with JSON file storage, optional Git versioning,
@@ -43,42 +100,122 @@ class TemplateManager:
             else:
                 self.repo = git.Repo(repo_full)
             logger.info(f"Git repo initialized at {repo_path}")
+            # Commits run on a single background worker and are coalesced
+            self._git_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="template-git")
+            self._git_lock = threading.Lock()
+            self._pending_commits: List[tuple] = []  # (op, path, message)
+            self._commit_scheduled = False
+            atexit.register(self._git_pool.shutdown, wait=True)
         self.analytics_file = self.dir / "analytics.json"
         self.cache: Dict[str, Dict] = {}  # In-mem cache for performance
+        self._cache_mtimes: Dict[str, int] = {}  # st_mtime_ns of the file each cache entry came from
+        # Inverted tag index (tag -> template names), refreshed from file mtimes on search
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._index_mtimes: Dict[str, int] = {}
+        self._index_tags: Dict[str, FrozenSet[str]] = {}
+        # Directory listing is only rescanned when the directory mtime changes
+        self._dir_mtime: Optional[int] = None
+        self._name_list: List[str] = []
+        # Tag index persisted across restarts; loaded lazily on first search
+        self.index_file = self.dir / ".tag_index.json"
+        self._persisted_index: Optional[Dict[str, tuple]] = None
+        # (digest, st_mtime_ns, st_size) of the last payload written per template, to skip idempotent saves
+        self._digests: Dict[str, Tuple[bytes, int, int]] = {}
+        # (name, frozen changes) -> (source template, merged result) for modify_template
+        self._merge_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Version history per template, valid while (HEAD sha, file mtime) is unchanged
+        self._versions_cache: Dict[str, tuple] = {}
+        # Usage stats live in memory and are flushed to disk at most every STATS_FLUSH_INTERVAL
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        if self.analytics_file.exists():
+            try:
+                self._stats = _loads(self.analytics_file.read_bytes())
+            except Exception as e:
+                logger.warning(f"Could not read analytics file: {e}")
+        self._stats_dirty = False
+        self._stats_last_flush = time.monotonic()
+        self._stats_lock = threading.RLock()
+        self._pending_events = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_stats)
 
     def _path(self, name: str) -> Path:
         """Get the file path for a template."""
         return self.dir / f"{name}.json"
 
+    def _iter_template_entries(self):
+        """Yield directory entries for template files (excluding analytics and hidden files)."""
+        for e in _iter_suffix(self.dir, ".json"):
+            if e.name != "analytics.json" and not e.name.startswith("."):
+                yield e
+
+    def _template_names(self) -> List[str]:
+        """Template names, rescanned only when the directory mtime changes."""
+        mtime = os.stat(self.dir).st_mtime_ns
+        if mtime != self._dir_mtime:
+            self._name_list = [e.name[:-5] for e in self._iter_template_entries()]
+            self._dir_mtime = mtime
+        return self._name_list
+
+    def _mark_dir_changed(self):
+        """Force the next listing to rescan (guards coarse directory mtimes)."""
+        self._dir_mtime = None
+
     def list_templates(self, include_versions: bool = False) -> List[Dict[str, Any]]:
         """List all saved templates with optional version history."""
-        names = [f.stem for f in self.dir.glob("*.json") if f.name != "analytics.json"]
-        out = [{"name": n} for n in names]
+        out = [{"name": n} for n in self._template_names()]
         if include_versions and self.repo:
+            self._wait_for_commits()
+            try:
+                head = self.repo.head.commit.hexsha
+            except Exception:
+                head = None  # Empty repository
             for entry in out:
+                name = entry["name"]
                 try:
-                    commits = list(self.repo.iter_commits(paths=str(self._path(entry["name"])), max_count=10))
+                    path = self._path(name)
+                    mtime = path.stat().st_mtime
+                    cached = self._versions_cache.get(name)
+                    if cached is not None and cached[:2] == (head, mtime):
+                        entry["versions"] = cached[2]
+                        continue
+                    commits = list(self.repo.iter_commits(paths=str(path), max_count=10)) if head else []
                     entry["versions"] = [{
                         "hex": c.hexsha[:8],
                         "msg": c.message.strip(),
                         "time": c.committed_datetime.isoformat()
                     } for c in commits]
+                    self._versions_cache[name] = (head, mtime, entry["versions"])
                 except Exception as e:
-                    logger.warning(f"Version fetch error for {entry['name']}: {e}")
+                    logger.warning(f"Version fetch error for {name}: {e}")
         return out
 
     def save_template(self, name: str, data: Dict[str, Any], commit_message: Optional[str] = None) -> str:
         """Save or update a template with JSON data."""
         path = self._path(name)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps(data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        try:
+            st = path.stat()
+            on_disk = (digest, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            on_disk = None
+        if on_disk is not None and self._digests.get(name) == on_disk:
+            # Unchanged content and the file is still the one we wrote: skip the write and the git commit
+            logger.info(f"Template '{name}' unchanged, skipping write")
+        else:
+            # Write to a sibling and rename so readers never see a torn file
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+            st = path.stat()
+            self._digests[name] = (digest, st.st_mtime_ns, st.st_size)
+            if self.repo:
+                self._queue_commit("add", path, commit_message or f"Update template: {name}")
         self.cache[name] = data
-        if self.repo:
-            try:
-                self.repo.index.add([str(path)])
-                self.repo.index.commit(commit_message or f"Update template: {name}")
-            except Exception as e:
-                logger.warning(f"Git commit failed: {e}")
+        self._cache_mtimes[name] = st.st_mtime_ns
+        self._invalidate_merges(name)
+        self._mark_dir_changed()
         # Add schema hints for better LLM usage
         if "tags" not in data:
             logger.info(f"Hint: Add 'tags' to template '{name}' for better search (e.g., ['animation', 'lighting'])")
@@ -87,21 +224,38 @@ class TemplateManager:
         return f"Template '{name}' saved."
 
     def load_template(self, name: str) -> Dict[str, Any]:
-        """Load a template from file or cache."""
-        if name in self.cache:
-            return self.cache[name]
+        """
+        Load a template from file or cache.
+        The returned dict is shared with the cache and must be treated as read-only;
+        derive modified copies with deep_merge.
+        """
         path = self._path(name)
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.cache.pop(name, None)
+            self._cache_mtimes.pop(name, None)
             raise FileNotFoundError(f"Template '{name}' not found.")
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if name in self.cache and self._cache_mtimes.get(name) == mtime:
+            return self.cache[name]
+        data = _intern_template(_loads(path.read_bytes()))
         self.cache[name] = data
+        self._cache_mtimes[name] = mtime
         return data
 
     def modify_template(self, name: str, changes: Dict[str, Any], save: bool = False) -> Dict[str, Any]:
         """Apply changes to a template in-memory, optionally saving."""
         template = self.load_template(name)
-        merged = deep_merge(template, changes)
+        key = (name, _freeze(changes))
+        cached = self._merge_cache.get(key)
+        if cached is not None and cached[0] is template:
+            self._merge_cache.move_to_end(key)
+            merged = cached[1]
+        else:
+            merged = deep_merge(template, changes)
+            self._merge_cache[key] = (template, merged)
+            if len(self._merge_cache) > MERGE_CACHE_SIZE:
+                self._merge_cache.popitem(last=False)
         if save:
             return self.save_template(name, merged, f"Modified: {name}")
         logger.info(f"Modified '{name}' in-memory (not saved)")
@@ -112,66 +266,306 @@ class TemplateManager:
         path = self._path(name)
         if path.exists():
             path.unlink()
+            self.cache.pop(name, None)
+            self._cache_mtimes.pop(name, None)
+            self._digests.pop(name, None)
+            self._invalidate_merges(name)
+            self._drop_from_index(name)
+            self._mark_dir_changed()
             if self.repo:
-                try:
-                    self.repo.index.remove([str(path)], working_tree=True)
-                    self.repo.index.commit(f"Delete template {name}")
-                except Exception as e:
-                    logger.warning(f"Git delete commit failed: {e}")
+                self._queue_commit("remove", path, f"Delete template {name}")
+            self._maybe_flush()
             return f"Template '{name}' deleted."
         else:
             raise FileNotFoundError(f"Template '{name}' not found.")
 
+    def _queue_commit(self, op: str, path: Path, message: str):
+        """Queue a git add/remove and schedule a background commit if none is pending."""
+        with self._git_lock:
+            self._pending_commits.append((op, str(path.resolve()), message))
+            if self._commit_scheduled:
+                return
+            self._commit_scheduled = True
+        self._git_pool.submit(self._flush_commits)
+
+    def _flush_commits(self):
+        """Commit all queued template changes at once (runs on the git worker)."""
+        with self._git_lock:
+            pending, self._pending_commits = self._pending_commits, []
+            self._commit_scheduled = False
+        if not pending:
+            return
+        # Each path is committed in its final state, so only the last queued operation counts
+        messages = {p: msg for _, p, msg in pending}
+        try:
+            self._commit_paths(list(messages), "\n".join(msg for _, _, msg in pending))
+        except Exception as e:
+            # Retry per template so one bad entry doesn't drop unrelated changes
+            logger.warning(f"Git commit failed, retrying per template: {e}")
+            for p, msg in messages.items():
+                try:
+                    self._commit_paths([p], msg)
+                except Exception as err:
+                    logger.warning(f"Git commit failed for {p}: {err}")
+
+    def _commit_paths(self, paths: List[str], message: str):
+        """Stage paths as they are on disk (added if present, untracked if gone) and commit."""
+        added, removed = [], []
+        for p in paths:
+            (added if os.path.exists(p) else removed).append(p)
+        if added:
+            self.repo.index.add(added)
+        if removed:
+            # delete_template already unlinked the files; only drop them from the index
+            self.repo.index.remove(removed, working_tree=False, ignore_unmatch=True)
+        self.repo.index.commit(message)
+
+    def _wait_for_commits(self):
+        """Block until queued commits have been written."""
+        self._git_pool.submit(lambda: None).result()
+
+    def _invalidate_merges(self, name: str):
+        """Drop cached modify_template results for a template."""
+        for key in [k for k in self._merge_cache if k[0] == name]:
+            del self._merge_cache[key]
+
     def search_templates(self, tags: List[str]) -> List[str]:
         """Search templates by tags."""
-        matches = []
-        for entry in self.list_templates():
+        self._rebuild_index_if_stale()
+        if not tags:
+            return sorted(self._index_mtimes)
+        query = frozenset(tags)
+        buckets = [self._tag_index.get(t) for t in query]
+        if None in buckets:
+            return []
+        # Scan the rarest tag's bucket and keep templates whose tag set covers the query
+        index_tags = self._index_tags
+        return sorted(n for n in min(buckets, key=len) if query <= index_tags[n])
+
+    def _rebuild_index_if_stale(self):
+        """
+        Re-parse templates whose mtime changed and update the tag index.
+        Every file is stat'ed, since in-place edits don't change the directory mtime.
+        Entries in the on-disk index whose mtime still matches are reused
+        without parsing the template.
+        """
+        if self._persisted_index is None:
+            self._persisted_index = self._read_index_file()
+        changed = False
+        seen = set()
+        for e in self._iter_template_entries():
+            name = e.name[:-5]
+            seen.add(name)
             try:
-                data = self.load_template(entry["name"])
-                t_tags = data.get("tags", [])
-                if set(tags).issubset(set(t_tags)):
-                    matches.append(entry["name"])
-            except Exception as e:
-                logger.error(f"Load error for {entry['name']}: {e}")
-        return matches
+                mtime = e.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self._index_mtimes.get(name) == mtime:
+                continue
+            self._drop_from_index(name)
+            changed = True
+            persisted = self._persisted_index.pop(name, None)
+            if self._cache_mtimes.get(name) == mtime:
+                # Cached copy is current (e.g. just saved): index it without re-reading the file,
+                # so the cached dict, and caches keyed on its identity, stay valid
+                t_tags = frozenset(self.cache[name].get("tags", []))
+            elif persisted is not None and persisted[0] == mtime:
+                t_tags = frozenset(sys.intern(t) if t.__class__ is str else t for t in persisted[1])
+            else:
+                try:
+                    data = _intern_template(_loads(Path(e.path).read_bytes()))
+                    t_tags = frozenset(data.get("tags", []))
+                except Exception as err:
+                    logger.error(f"Load error for {name}: {err}")
+                    continue
+                self.cache[name] = data
+                self._cache_mtimes[name] = mtime
+            self._index_mtimes[name] = mtime
+            self._index_tags[name] = t_tags
+            for t in t_tags:
+                self._tag_index.setdefault(t, set()).add(name)
+        # Prune templates deleted from disk
+        for name in list(self._index_mtimes):
+            if name not in seen:
+                self._drop_from_index(name)
+                self.cache.pop(name, None)
+                self._cache_mtimes.pop(name, None)
+                changed = True
+        if changed:
+            self._write_index_file()
+
+    def _read_index_file(self) -> Dict[str, tuple]:
+        """Read the persisted tag index as {name: (mtime_ns, tags)}."""
+        if not self.index_file.exists():
+            return {}
+        try:
+            raw = _loads(self.index_file.read_bytes())
+            return {name: (entry["mtime"], entry["tags"]) for name, entry in raw.items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tag index: {e}")
+            return {}
+
+    def _write_index_file(self):
+        """Atomically persist the tag index next to the templates."""
+        payload = {
+            name: {"mtime": mtime, "tags": list(self._index_tags.get(name, ()))}
+            for name, mtime in self._index_mtimes.items()
+        }
+        tmp = self.index_file.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(_dumps(payload))
+            os.replace(tmp, self.index_file)
+        except Exception as e:
+            logger.warning(f"Tag index write failed: {e}")
+
+    def _drop_from_index(self, name: str):
+        """Remove a template from the tag index."""
+        self._index_mtimes.pop(name, None)
+        for t in self._index_tags.pop(name, ()):
+            bucket = self._tag_index.get(t)
+            if bucket is not None:
+                bucket.discard(name)
+                if not bucket:
+                    del self._tag_index[t]
 
     def _log_usage(self, name: str, duration: float, success: bool):
-        """Log template usage for analytics."""
-        stats = {}
+        """Log template usage for analytics (buffered in memory; see _maybe_flush)."""
+        with self._stats_lock:
+            entry = self._stats.setdefault(name, {"uses": 0, "total_time": 0.0, "successes": 0})
+            entry["uses"] += 1
+            entry["total_time"] += duration
+            if success:
+                entry["successes"] += 1
+            entry["success_rate"] = entry["successes"] / entry["uses"] if entry["uses"] > 0 else 0.0
+            self._stats_dirty = True
+            self._pending_events += 1
+            flush_now = self._pending_events >= USAGE_FLUSH_EVENTS
+        if flush_now:
+            self._flush_stats()
+        else:
+            self._maybe_flush()
+
+    def _maybe_flush(self):
+        """
+        Flush usage stats if the last flush is older than STATS_FLUSH_INTERVAL,
+        otherwise make sure a background flush is scheduled.
+        """
+        if time.monotonic() - self._stats_last_flush > STATS_FLUSH_INTERVAL:
+            self._flush_stats()
+            return
+        with self._stats_lock:
+            if self._flush_timer is None and self._stats_dirty:
+                self._flush_timer = threading.Timer(STATS_FLUSH_INTERVAL, self._flush_stats)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_usage(self):
+        """Write buffered usage stats to disk now."""
+        self._flush_stats()
+
+    def _flush_stats(self):
+        """Atomically write pending usage stats to the analytics file."""
         af = self.analytics_file
-        if af.exists():
+        with self._stats_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._stats_dirty or not af.parent.exists():
+                return
+            tmp = af.with_suffix(".tmp")
             try:
-                with open(af, "r", encoding="utf-8") as f:
-                    stats = json.load(f)
-            except Exception:
-                pass
-        entry = stats.setdefault(name, {"uses": 0, "total_time": 0.0, "successes": 0})
-        entry["uses"] += 1
-        entry["total_time"] += duration
-        if success:
-            entry["successes"] += 1
-        entry["success_rate"] = entry["successes"] / entry["uses"] if entry["uses"] > 0 else 0.0
-        with open(af, "w", encoding="utf-8") as f:
-            json.dump(stats, f, indent=2)
+                tmp.write_bytes(_dumps(self._stats))
+                os.replace(tmp, af)
+            except Exception as e:
+                logger.warning(f"Analytics flush failed: {e}")
+                return
+            self._stats_dirty = False
+            self._pending_events = 0
+            self._stats_last_flush = time.monotonic()
 
     def get_stats(self, name: Optional[str] = None) -> Dict[str, Any]:
-        """Get usage analytics."""
-        if self.analytics_file.exists():
-            with open(self.analytics_file, "r", encoding="utf-8") as f:
-                stats = json.load(f)
-            return {name: stats.get(name, {})} if name else stats
-        return {}
+        """Get a snapshot of usage analytics (mutating it does not affect recorded stats)."""
+        with self._stats_lock:
+            if name:
+                return {name: dict(self._stats.get(name, {}))}
+            return {k: dict(v) for k, v in self._stats.items()}
+
+
+def _freeze(o: Any) -> Any:
+    """Convert a JSON-like value into a hashable equivalent."""
+    if isinstance(o, dict):
+        return frozenset((k, _freeze(v)) for k, v in o.items())
+    if isinstance(o, list):
+        return tuple(_freeze(v) for v in o)
+    # Tag scalars with their type: True, 1 and 1.0 are equal and hash alike but are distinct JSON values
+    return (o.__class__, o)
 
 
 def deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     """
     Recursively merge dictionary b into a, returning a new dict.
-    Non-destructive to inputs.
+    Non-destructive to inputs. Walks nested dicts with an explicit stack,
+    copying a nested dict only when both sides have a dict at that key.
+    Only plain dicts (as produced by JSON parsing) are merged recursively;
+    levels whose keys don't overlap are combined with a single shallow merge.
     """
-    out = dict(a)
-    for k, v in b.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = deep_merge(out[k], v)
-        else:
-            out[k] = v
-    return out
\ No newline at end of file
+    if not (a.keys() & b.keys()):
+        return {**a, **b}
+    out: Dict[str, Any] = {**a}
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(out, b)]
+    while stack:
+        dst, src = stack.pop()
+        get = dst.get
+        for k, v in src.items():
+            cur = get(k)
+            if cur.__class__ is dict and v.__class__ is dict:
+                if cur.keys() & v.keys():
+                    nxt: Dict[str, Any] = {**cur}
+                    dst[k] = nxt
+                    stack.append((nxt, v))
+                else:
+                    dst[k] = {**cur, **v}
+            else:
+                dst[k] = v
+    return out
+
+
+class MergedView(Mapping):
+    """
+    Read-only view of deep_merge(base, changes).
+    Construction is O(1); nested dicts present on both sides are wrapped lazily
+    on access instead of being copied. Only for consumers that read the result
+    (e.g. resolving actions); use deep_merge when a concrete dict is needed.
+    """
+
+    __slots__ = ("_changes", "_base")
+
+    def __init__(self, changes: Dict[str, Any], base: Dict[str, Any]):
+        self._changes = changes
+        self._base = base
+
+    def __getitem__(self, key):
+        changes = self._changes
+        if key in changes:
+            v = changes[key]
+            cur = self._base.get(key)
+            if v.__class__ is dict and cur.__class__ is dict:
+                return MergedView(v, cur)
+            return v
+        return self._base[key]
+
+    def __contains__(self, key):
+        return key in self._changes or key in self._base
+
+    def __iter__(self):
+        changes = self._changes
+        yield from changes
+        for k in self._base:
+            if k not in changes:
+                yield k
+
+    def __len__(self):
+        return len(self._changes.keys() | self._base.keys())
+
+    def __repr__(self):
+        return f"MergedView({self._changes!r}, {self._base!r})"
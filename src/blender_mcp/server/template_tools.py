@@ -4,14 +4,132 @@ MCP tools for managing and applying Blender operation templates.
 """
 
 from .connection import mcp, get_blender_connection, logger
-from .template_engine import TemplateManager, deep_merge
+from .template_engine import TemplateManager, MergedView
 import time
-from typing import List, Dict, Optional, Any
+import logging
+import threading
+import contextvars
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from mcp.server.fastmcp.exceptions import ToolError
 
 # Global template manager instance
 template_manager = TemplateManager(repo_path="templates_repo")
 
+# (tool_name, callable, params) for one template action
+ResolvedAction = Tuple[str, Callable[..., Any], Dict[str, Any]]
+# Consecutive actions that may run together; sequential steps are batches of one
+ActionBatch = List[ResolvedAction]
+
+# Resolved action batches per template, valid while the loaded actions list is unchanged
+_resolved_actions: Dict[str, Tuple[List[Any], List[ActionBatch]]] = {}
+
+# Worker pool for template steps marked "parallel": true; workers flag themselves so
+# templates applied from inside a parallel step run their batches inline
+_step_worker = threading.local()
+_step_pool = ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix="template-step",
+    initializer=lambda: setattr(_step_worker, "active", True),
+)
+
+def _resolve_tool(tool_name: str) -> Callable[..., Any]:
+    """
+    Resolve a registered MCP tool name to a directly callable function.
+    Arguments are still validated against the tool's FastMCP argument model,
+    as they would be by mcp.call_tool.
+    """
+    tool = mcp._tool_manager.get_tool(tool_name)
+    if tool is None:
+        raise ToolError(f"Unknown tool '{tool_name}'")
+    if tool.is_async:
+        raise ToolError(f"Tool '{tool_name}' is async and cannot be used in templates")
+    fn = tool.fn
+    arg_model = tool.fn_metadata.arg_model
+    context_kwarg = tool.context_kwarg
+
+    def call(**params):
+        args = arg_model.model_validate(params).model_dump_one_level()
+        if context_kwarg:
+            args[context_kwarg] = mcp.get_context()
+        return fn(**args)
+    return call
+
+def _resolve_actions(name: str, data: Dict[str, Any], cache: bool = True) -> List[ActionBatch]:
+    """
+    Validate a template's actions and resolve them to callables, grouping
+    consecutive steps marked "parallel": true into one batch.
+    Cached per loaded actions list, so validation is paid once per template version
+    and skipped for overrides that leave the actions untouched.
+    """
+    actions = data.get("actions", [])
+    cached = _resolved_actions.get(name)
+    if cached is not None and cached[0] is actions:
+        return cached[1]
+    batches: List[ActionBatch] = []
+    prev_parallel = False
+    for step in actions:
+        step_get = step.get if isinstance(step, dict) else None
+        if step_get is None or (tool_name := step_get("tool")) is None or (params := step_get("params")) is None:
+            raise ToolError(f"Invalid action structure in template '{name}': Requires 'tool' and 'params' keys")
+        action = (tool_name, _resolve_tool(tool_name), params)
+        parallel = bool(step_get("parallel"))
+        if parallel and prev_parallel:
+            batches[-1].append(action)
+        else:
+            batches.append([action])
+        prev_parallel = parallel
+    if cache:
+        _resolved_actions[name] = (actions, batches)
+    return batches
+
+def _run_step(tool_name: str, fn: Callable[..., Any], params: Dict[str, Any], log_step: bool):
+    """Execute one resolved action, wrapping failures in a ToolError."""
+    if log_step:
+        logger.info("Applying step tool=%s params=%s", tool_name, params)
+    try:
+        fn(**params)
+    except Exception as inner_e:
+        logger.error(f"Error during step {tool_name}: {inner_e}")
+        raise ToolError(f"Error calling tool '{tool_name}' with params {params}: {inner_e}")
+
+def _run_actions(batches: List[ActionBatch]):
+    """
+    Execute resolved action batches in order; steps within a batch run concurrently.
+    On a step worker (a nested apply) batches run inline, since waiting on the pool
+    from inside it could deadlock once every worker is waiting.
+    """
+    log_steps = logger.isEnabledFor(logging.INFO)
+    nested = getattr(_step_worker, "active", False)
+    # Bound once for the loop below
+    run_step = _run_step
+    submit = _step_pool.submit
+    copy_context = contextvars.copy_context
+    for batch in batches:
+        if len(batch) == 1 or nested:
+            for action in batch:
+                run_step(*action, log_steps)
+            continue
+        # Each step gets its own copy of the request context (e.g. for mcp.get_context())
+        futures = [submit(copy_context().run, run_step, *action, log_steps) for action in batch]
+        _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for f in pending:
+            f.cancel()
+        wait(pending)
+        for f in futures:
+            if f.done() and not f.cancelled() and f.exception() is not None:
+                raise f.exception()
+
+def _apply_fast(name: str):
+    """Apply a template as saved, reusing its cached resolved actions."""
+    data = template_manager.load_template(name)
+    _run_actions(_resolve_actions(name, data))
+
+def _apply_with_overrides(name: str, overrides: Dict[str, Any]):
+    """Apply a template with overrides merged in; actions are resolved per call."""
+    data = MergedView(overrides, template_manager.load_template(name))
+    _run_actions(_resolve_actions(name, data, cache=False))
+
 @mcp.tool()
 def list_templates(include_versions: bool = False) -> List[Dict[str, Any]]:
     """
@@ -36,8 +154,10 @@ def create_template(name: str, config: Dict[str, Any]) -> str:
     - name: Template name (used as filename)
     - config: Template configuration (JSON structure with actions, tags, etc.)
     """
-    logger.info(f"Tool: create_template called: {name}")
+    logger.info("Tool: create_template called: %s", name)
     try:
+        # Validate before writing; the saved dict is cached, so apply reuses this resolution
+        _resolve_actions(name, config)
         return template_manager.save_template(name, config)
     except Exception as e:
         logger.error(f"create_template error: {e}")
@@ -53,33 +173,18 @@ def apply_template(name: str, overrides: Optional[Dict[str, Any]] = None) -> str
     - name: Template name to apply
     - overrides: Optional parameter overrides (deep-merged into template)
     """
-    logger.info(f"Tool: apply_template called: {name}")
-    start = time.time()
+    logger.info("Tool: apply_template called: %s", name)
+    start = time.perf_counter_ns()
     try:
-        data = template_manager.load_template(name)
         if overrides:
-            data = deep_merge(data, overrides)
-        # Validate template actions
-        for step in data.get("actions", []):
-            if not all(k in step for k in ['tool', 'params']):
-                raise ToolError(f"Invalid action in template '{name}': Missing 'tool' or 'params'")
-        # Validate and execute actions (call other MCP tools)
-        for step in data.get("actions", []):
-            if not isinstance(step, dict) or step.get("tool") is None or step.get("params") is None:
-                raise ToolError(f"Invalid action structure in template '{name}': Requires 'tool' and 'params' keys")
-            tool_name = step.get("tool")
-            params = step.get("params", {})
-            logger.info(f"Applying step tool={tool_name} params={params}")
-            try:
-                mcp.call_tool(tool_name, **params)
-            except Exception as inner_e:
-                logger.error(f"Error during step {tool_name}: {inner_e}")
-                raise ToolError(f"Error calling tool '{tool_name}' with params {params}: {inner_e}")
-        duration = time.time() - start
+            _apply_with_overrides(name, overrides)
+        else:
+            _apply_fast(name)
+        duration = (time.perf_counter_ns() - start) / 1e9
         template_manager._log_usage(name, duration, True)
         return f"Applied template '{name}' successfully (time: {duration:.2f}s)."
     except Exception as e:
-        duration = time.time() - start
+        duration = (time.perf_counter_ns() - start) / 1e9
         template_manager._log_usage(name, duration, False)
         logger.error(f"apply_template failed: {e}")
         raise ToolError(f"Failed to apply template '{name}': {e}")
@@ -92,7 +197,7 @@ def search_templates(tags: List[str]) -> List[str]:
     Parameters:
     - tags: List of tags to search for (template must have all specified tags)
     """
-    logger.info(f"Tool: search_templates called tags={tags}")
+    logger.info("Tool: search_templates called tags=%s", tags)
     try:
         return template_manager.search_templates(tags)
     except Exception as e:
@@ -107,7 +212,7 @@ def get_template_stats(name: Optional[str] = None) -> Dict[str, Any]:
     Parameters:
     - name: Optional template name (returns stats for all if None)
     """
-    logger.info(f"Tool: get_template_stats called name={name}")
+    logger.info("Tool: get_template_stats called name=%s", name)
     try:
         return template_manager.get_stats(name)
     except Exception as e:
@@ -124,7 +229,7 @@ def modify_template(name: str, changes: Dict[str, Any], save: bool = False) -> D
     - changes: Changes to apply (deep-merged)
     - save: Whether to save the modified template
     """
-    logger.info(f"Tool: modify_template called: {name}, save={save}")
+    logger.info("Tool: modify_template called: %s, save=%s", name, save)
     try:
         return template_manager.modify_template(name, changes, save)
     except Exception as e:
@@ -139,7 +244,7 @@ def delete_template(name: str) -> str:
     Parameters:
     - name: Template name to delete
     """
-    logger.info(f"Tool: delete_template called: {name}")
+    logger.info("Tool: delete_template called: %s", name)
     try:
         return template_manager.delete_template(name)
     except Exception as e:
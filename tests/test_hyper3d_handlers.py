@@ -0,0 +1,158 @@
+"""
+Unit tests for the Hyper3D Rodin handlers (HTTP retries and poll caching)
+Run with: python -m pytest tests/test_hyper3d_handlers.py
+"""
+
+import copy
+import sys
+import types
+import pytest
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# The addon module imports bpy at import time; these tests never touch Blender
+sys.modules.setdefault("bpy", types.ModuleType("bpy"))
+from src.blender_mcp.addon import hyper3d_handlers
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {} if retry_after is None else {"Retry-After": str(retry_after)}
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Session returning (or raising) queued outcomes in order."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def connect_error():
+    """A ConnectionError raised before the request reached the server."""
+    return requests.exceptions.ConnectionError(types.SimpleNamespace(reason=NewConnectionError(None, "refused")))
+
+
+class TestRequestWithBackoff:
+    """Test retry classification, Retry-After handling and the retry budget."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        self.sleeps = []
+        monkeypatch.setattr(hyper3d_handlers.time, "sleep", self.sleeps.append)
+        monkeypatch.setattr(hyper3d_handlers, "RETRY_BASE", 0.01)
+        monkeypatch.setattr(hyper3d_handlers, "RETRY_JITTER", 0.0)
+
+    def send(self, outcomes, **kwargs):
+        handlers = hyper3d_handlers.Hyper3DHandlers()
+        handlers._session = FakeSession(outcomes)
+        return handlers._request_with_backoff("POST", "https://example.invalid", **kwargs), handlers._session
+
+    def test_idempotent_requests_retry_server_errors(self):
+        """Test GET-style requests retry 5xx responses and timeouts."""
+        response, session = self.send([FakeResponse(500), requests.exceptions.ReadTimeout(), FakeResponse(200)])
+        assert response.status_code == 200
+        assert len(session.calls) == 3
+
+    def test_non_idempotent_requests_do_not_retry_processed_failures(self):
+        """Test job-creating requests are not resent once the server may have processed them."""
+        response, session = self.send([FakeResponse(500), FakeResponse(200)], idempotent=False)
+        assert response.status_code == 500
+        assert len(session.calls) == 1
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            self.send([requests.exceptions.ReadTimeout(), FakeResponse(200)], idempotent=False)
+
+    def test_non_idempotent_requests_retry_unprocessed_failures(self):
+        """Test job-creating requests are resent after 429/503 and failed connections."""
+        response, session = self.send([FakeResponse(503), connect_error(), FakeResponse(200)], idempotent=False)
+        assert response.status_code == 200
+        assert len(session.calls) == 3
+
+    def test_retry_after_is_honoured(self):
+        """Test the wait is at least the server's Retry-After."""
+        response, session = self.send([FakeResponse(429, retry_after=2), FakeResponse(200)])
+        assert response.status_code == 200
+        assert self.sleeps == [2]
+
+    def test_retry_after_beyond_budget_returns_response(self, monkeypatch):
+        """Test a Retry-After longer than the budget returns the throttled response without waiting."""
+        response, session = self.send([FakeResponse(429, retry_after=3600), FakeResponse(200)])
+        assert response.status_code == 429
+        assert len(session.calls) == 1
+        assert self.sleeps == []
+
+    def test_attempts_are_bounded_by_budget(self, monkeypatch):
+        """Test each attempt has a timeout and no retry starts once the budget is spent."""
+        monkeypatch.setattr(hyper3d_handlers, "RETRY_BUDGET", 0.0)
+        response, session = self.send([FakeResponse(500), FakeResponse(200)])
+        assert response.status_code == 500
+        assert 0 < session.calls[0]["timeout"] <= hyper3d_handlers.REQUEST_TIMEOUT
+
+
+class TestPollCache:
+    """Test sharing of recent poll results between callers."""
+
+    @pytest.fixture(autouse=True)
+    def handlers(self, monkeypatch):
+        scene = types.SimpleNamespace(blendermcp_hyper3d_mode="MAIN_SITE", blendermcp_hyper3d_api_key="key")
+        monkeypatch.setattr(hyper3d_handlers.bpy, "context", types.SimpleNamespace(scene=scene), raising=False)
+        self.handlers = hyper3d_handlers.Hyper3DHandlers()
+        self.fetches = []
+        self.status = {"status_list": ["Generating"]}
+
+        def fetch(mode, api_key, subscription_key=None, request_id=None):
+            self.fetches.append(subscription_key)
+            return copy.deepcopy(self.status)
+        self.handlers._fetch_rodin_job_status = fetch
+
+    def test_poll_results_are_shared_within_ttl(self):
+        """Test repeated polls within the TTL hit the cache and get independent copies."""
+        first = self.handlers.poll_rodin_job_status(subscription_key="job")
+        first["status_list"].append("mutated")
+        second = self.handlers.poll_rodin_job_status(subscription_key="job")
+
+        assert self.fetches == ["job"]
+        assert second == {"status_list": ["Generating"]}
+        assert second is not self.handlers.poll_rodin_job_status(subscription_key="job")
+
+    def test_poll_results_expire(self, monkeypatch):
+        """Test polls after the TTL go back to the provider."""
+        monkeypatch.setattr(hyper3d_handlers, "POLL_CACHE_TTL", 0.0)
+        self.handlers.poll_rodin_job_status(subscription_key="job")
+        self.handlers.poll_rodin_job_status(subscription_key="job")
+        assert self.fetches == ["job", "job"]
+
+    @pytest.mark.parametrize("status", [{"status": "COMPLETED"}, {"error": "boom"}])
+    def test_terminal_and_failed_polls_are_not_cached(self, status):
+        """Test finished or failed polls are always re-fetched."""
+        self.status = status
+        self.handlers.poll_rodin_job_status(subscription_key="job")
+        self.handlers.poll_rodin_job_status(subscription_key="job")
+        assert self.fetches == ["job", "job"]
+
+    def test_least_recently_used_poll_is_evicted(self, monkeypatch):
+        """Test the cache keeps at most POLL_CACHE_SIZE jobs, dropping the oldest."""
+        monkeypatch.setattr(hyper3d_handlers, "POLL_CACHE_SIZE", 2)
+        for job in ("a", "b", "c", "b", "a"):
+            self.handlers.poll_rodin_job_status(subscription_key=job)
+
+        assert self.fetches == ["a", "b", "c", "a"]
+        assert len(self.handlers._poll_cache) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
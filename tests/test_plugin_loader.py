@@ -0,0 +1,76 @@
+"""
+Unit tests for the Blender MCP plugin loader
+Run with: python -m pytest tests/test_plugin_loader.py
+"""
+
+import os
+import sys
+import pytest
+from src.blender_mcp.server.plugin_loader import PluginLoader, PLUGIN_NAMESPACE
+
+
+class TestPluginLoader:
+    """Test PluginLoader functionality."""
+
+    @pytest.fixture(autouse=True)
+    def loader(self, tmp_path):
+        """Create a loader on an empty plugin directory and unregister plugins afterwards."""
+        self.plugin_dir = tmp_path / "plugins"
+        self.loader = PluginLoader(plugin_dir=str(self.plugin_dir))
+        yield
+        for name in [n for n in sys.modules if n == PLUGIN_NAMESPACE or n.startswith(PLUGIN_NAMESPACE + ".")]:
+            del sys.modules[name]
+
+    def write_plugin(self, name, source):
+        path = self.plugin_dir / f"{name}.py"
+        path.write_text(source, encoding="utf-8")
+        return path
+
+    def test_unchanged_plugins_are_skipped(self):
+        """Test a plugin is only re-executed when its mtime changes."""
+        path = self.write_plugin("alpha", "VALUE = 1\n")
+        self.loader.load_all()
+        first = sys.modules[f"{PLUGIN_NAMESPACE}.alpha"]
+
+        self.loader.load_all()
+        assert sys.modules[f"{PLUGIN_NAMESPACE}.alpha"] is first
+
+        path.write_text("VALUE = 2\n", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.loader.load_all()
+        assert sys.modules[f"{PLUGIN_NAMESPACE}.alpha"].VALUE == 2
+
+    def test_plugins_can_import_each_other(self):
+        """Test a plugin can import an already loaded plugin through the namespace package."""
+        self.write_plugin("alpha", "VALUE = 1\n")
+        self.write_plugin("beta", "from blender_mcp_plugins import alpha\nVALUE = alpha.VALUE + 1\n")
+        self.loader.load_all()
+
+        assert sys.modules[f"{PLUGIN_NAMESPACE}.beta"].VALUE == 2
+        assert sys.modules[f"{PLUGIN_NAMESPACE}.beta"].alpha is sys.modules[f"{PLUGIN_NAMESPACE}.alpha"]
+
+    def test_dataclass_plugin_loads(self):
+        """Test plugins defining dataclasses with postponed annotations load."""
+        self.write_plugin(
+            "shapes",
+            "from __future__ import annotations\n"
+            "from dataclasses import dataclass\n\n"
+            "@dataclass\n"
+            "class Point:\n"
+            "    x: int\n",
+        )
+        self.loader.load_all()
+
+        assert sys.modules[f"{PLUGIN_NAMESPACE}.shapes"].Point(1).x == 1
+
+    def test_failed_plugin_is_not_registered(self):
+        """Test a plugin that raises on import is removed from sys.modules."""
+        self.write_plugin("broken", "raise RuntimeError('broken plugin')\n")
+        self.loader.load_all()
+
+        assert f"{PLUGIN_NAMESPACE}.broken" not in sys.modules
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -6,8 +6,10 @@ Run with: python -m pytest tests/test_templates.py
 import pytest
 import tempfile
 import os
+import threading
 from pathlib import Path
-from src.blender_mcp.server.template_engine import TemplateManager, deep_merge
+from src.blender_mcp.server import template_engine
+from src.blender_mcp.server.template_engine import TemplateManager, MergedView, deep_merge
 
 
 class TestTemplateManager:
@@ -32,6 +34,67 @@ class TestTemplateManager:
         loaded = self.manager.load_template("test_template")
         assert loaded == test_data
 
+    def test_load_template_sees_external_edit(self):
+        """Test cached templates are reloaded when the file changes on disk."""
+        self.manager.save_template("edited", {"value": 1})
+        assert self.manager.load_template("edited") == {"value": 1}
+
+        path = Path(self.temp_dir) / "edited.json"
+        path.write_text('{"value": 2}', encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert self.manager.load_template("edited") == {"value": 2}
+
+    def test_resave_overwrites_external_edit(self):
+        """Test saving unchanged data still rewrites a file that was edited on disk."""
+        self.manager.save_template("resaved", {"v": 1})
+        path = Path(self.temp_dir) / "resaved.json"
+        path.write_text('{"v": 2}', encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.manager.save_template("resaved", {"v": 1})
+
+        reloaded = TemplateManager(templates_dir=self.temp_dir)
+        assert reloaded.load_template("resaved") == {"v": 1}
+        assert self.manager.load_template("resaved") == {"v": 1}
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_json_backends_round_trip(self, monkeypatch, use_orjson):
+        """Test templates round-trip with both the orjson and stdlib JSON backends."""
+        if use_orjson and template_engine.orjson is None:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(template_engine, "HAS_ORJSON", use_orjson)
+        data = {"tags": ["ünïcode"], "actions": [{"tool": "t", "params": {"n": 1.5, "flag": None}}]}
+        self.manager.save_template("backend_test", data)
+
+        reloaded = TemplateManager(templates_dir=self.temp_dir)
+        assert reloaded.load_template("backend_test") == data
+
+    def test_git_batch_keeps_last_operation_per_path(self, tmp_path):
+        """Test a coalesced commit applies only the final save/delete of each template."""
+        if not template_engine.HAS_GIT:
+            pytest.skip("GitPython not installed")
+        manager = TemplateManager(templates_dir=str(tmp_path / "templates"), repo_path=str(tmp_path))
+        manager.save_template("x", {"v": 1})
+        manager._wait_for_commits()
+
+        # Hold the git worker so the following changes land in one batch
+        gate = threading.Event()
+        manager._git_pool.submit(gate.wait)
+        manager.delete_template("x")
+        manager.save_template("x", {"v": 1})
+        manager.save_template("y", {"v": 1})
+        manager.delete_template("y")
+        manager.save_template("z", {"v": 1})
+        gate.set()
+        manager._wait_for_commits()
+
+        assert manager.load_template("x") == {"v": 1}
+        assert manager.repo.git.ls_files().split() == ["templates/x.json", "templates/z.json"]
+        assert not manager.repo.is_dirty()
+
     def test_list_templates(self):
         """Test listing templates."""
         self.manager.save_template("template1", {"tags": ["tag1"]})
@@ -51,6 +114,49 @@ class TestTemplateManager:
         assert "anim_template" in results
         assert "light_template" not in results
 
+        assert self.manager.search_templates(["animation", "test"]) == ["anim_template"]
+        assert self.manager.search_templates(["test"]) == ["anim_template", "light_template"]
+
+        self.manager.delete_template("anim_template")
+        assert self.manager.search_templates(["test"]) == ["light_template"]
+
+    def test_search_uses_persisted_index(self):
+        """Test a fresh manager answers searches from the on-disk tag index."""
+        self.manager.save_template("anim_template", {"tags": ["animation"]})
+        self.manager.save_template("light_template", {"tags": ["lighting"]})
+        assert self.manager.search_templates(["lighting"]) == ["light_template"]
+
+        reloaded = TemplateManager(templates_dir=self.temp_dir)
+        assert reloaded.search_templates(["animation"]) == ["anim_template"]
+        assert reloaded.cache == {}
+        assert "anim_template" in [t["name"] for t in reloaded.list_templates()]
+        assert ".tag_index" not in [t["name"] for t in reloaded.list_templates()]
+
+    def test_search_sees_in_place_edits(self):
+        """Test repeated in-place edits are reflected by search as well as load."""
+        self.manager.save_template("s", {"tags": ["a"]})
+        assert self.manager.search_templates(["a"]) == ["s"]
+
+        path = Path(self.temp_dir) / "s.json"
+        for offset, tag in enumerate(["b", "c"], start=1):
+            with open(path, "r+", encoding="utf-8") as f:
+                f.truncate(0)
+                f.write(f'{{"tags": ["{tag}"]}}')
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset * 1_000_000_000))
+
+            assert self.manager.load_template("s") == {"tags": [tag]}
+            assert self.manager.search_templates([tag]) == ["s"]
+            assert self.manager.search_templates(["a"]) == []
+
+    def test_search_keeps_cached_template(self):
+        """Test indexing a freshly saved template reuses the cached dict instead of re-reading it."""
+        config = {"tags": ["kept"], "actions": []}
+        self.manager.save_template("kept", config)
+
+        assert self.manager.search_templates(["kept"]) == ["kept"]
+        assert self.manager.load_template("kept") is config
+
     def test_modify_template(self):
         """Test modifying templates."""
         original = {"tags": ["original"], "value": 1}
@@ -66,6 +172,24 @@ class TestTemplateManager:
         loaded = self.manager.load_template("modify_test")
         assert loaded == original
 
+    def test_modify_template_after_save(self):
+        """Test repeated modifications reflect the latest saved template."""
+        self.manager.save_template("modify_cache", {"value": 1, "nested": {"a": 1}})
+        changes = {"nested": {"b": 2}}
+        first = self.manager.modify_template("modify_cache", changes)
+        assert self.manager.modify_template("modify_cache", changes) == first
+
+        self.manager.save_template("modify_cache", {"value": 2, "nested": {"a": 3}})
+        assert self.manager.modify_template("modify_cache", changes) == {"value": 2, "nested": {"a": 3, "b": 2}}
+
+    def test_modify_template_distinguishes_scalar_types(self):
+        """Test changes with equal but differently typed values are not served from one cache entry."""
+        self.manager.save_template("modify_types", {"x": 0})
+
+        assert self.manager.modify_template("modify_types", {"x": 1}) == {"x": 1}
+        assert self.manager.modify_template("modify_types", {"x": True})["x"] is True
+        assert type(self.manager.modify_template("modify_types", {"x": 1.0})["x"]) is float
+
     def test_delete_template(self):
         """Test deleting templates."""
         self.manager.save_template("delete_test", {"test": "data"})
@@ -75,6 +199,29 @@ class TestTemplateManager:
         with pytest.raises(FileNotFoundError):
             self.manager.load_template("delete_test")
 
+    def test_usage_stats_flush(self):
+        """Test usage stats are tracked in memory and flushed to disk."""
+        self.manager._log_usage("stats_test", 1.5, True)
+        self.manager._log_usage("stats_test", 0.5, False)
+
+        stats = self.manager.get_stats("stats_test")["stats_test"]
+        assert stats["uses"] == 2
+        assert stats["successes"] == 1
+
+        self.manager.flush_usage()
+        reloaded = TemplateManager(templates_dir=self.temp_dir)
+        assert reloaded.get_stats("stats_test") == {"stats_test": stats}
+
+    def test_get_stats_returns_copy(self):
+        """Test mutating returned stats leaves the recorded stats intact."""
+        self.manager._log_usage("copy_test", 1.0, True)
+
+        self.manager.get_stats()["copy_test"]["uses"] = 99
+        self.manager.get_stats("copy_test")["copy_test"].clear()
+        self.manager.get_stats().clear()
+
+        assert self.manager.get_stats("copy_test")["copy_test"]["uses"] == 1
+
 
 class TestDeepMerge:
     """Test deep_merge utility function."""
@@ -97,6 +244,17 @@ class TestDeepMerge:
         expected = {"nested": {"inner1": "a", "inner2": "updated", "inner3": "new"}}
         assert result == expected
 
+    def test_untouched_subtrees_are_shared(self):
+        """Test only dicts on overridden paths are copied."""
+        a = {"actions": [{"tool": "t", "params": {}}], "meta": {"deep": {"x": 1}}, "cfg": {"y": 1}}
+        b = {"cfg": {"y": 2}}
+        result = deep_merge(a, b)
+
+        assert result["actions"] is a["actions"]
+        assert result["meta"] is a["meta"]
+        assert result["cfg"] == {"y": 2}
+        assert a["cfg"] == {"y": 1}
+
     def test_non_dict_values(self):
         """Test merging with non-dict values."""
         a = {"key": "original"}
@@ -113,6 +271,134 @@ class TestDeepMerge:
         result = deep_merge({"key": "value"}, {})
         assert result == {"key": "value"}
 
+    def test_deeply_nested_merge(self):
+        """Test merging nesting deeper than the recursion limit."""
+        depth = 5000
+        a, b = {}, {}
+        inner_a, inner_b = a, b
+        for _ in range(depth):
+            inner_a["n"] = {"keep": 1}
+            inner_b["n"] = {"add": 2}
+            inner_a, inner_b = inner_a["n"], inner_b["n"]
+
+        result = deep_merge(a, b)
+
+        node = result
+        for _ in range(depth):
+            node = node["n"]
+            assert node["keep"] == 1 and node["add"] == 2
+        assert "add" not in a["n"]
+
+    def test_merged_view_matches_deep_merge(self):
+        """Test the lazy merge view reads the same as a materialized merge."""
+        a = {"actions": [{"tool": "t", "params": {}}], "cfg": {"y": 1, "z": {"k": 1}}, "keep": 1}
+        b = {"cfg": {"z": {"k": 2}}, "new": [1]}
+        view = MergedView(b, a)
+
+        assert view == deep_merge(a, b)
+        assert view["cfg"]["z"]["k"] == 2 and view["cfg"]["y"] == 1
+        assert view.get("actions") is a["actions"]
+        assert a["cfg"]["z"]["k"] == 1
+        assert len(view) == 4 and list(view) == ["cfg", "new", "actions", "keep"]
+
+    def test_merged_view_is_read_only(self):
+        """Test the merge view cannot write through to the dicts it wraps."""
+        b = {"cfg": {"y": 2}}
+        view = MergedView(b, {"cfg": {"y": 1}})
+
+        with pytest.raises(TypeError):
+            view["q"] = 5
+        with pytest.raises(TypeError):
+            view["cfg"]["y"] = 3
+        assert not hasattr(view, "new_child")
+        assert b == {"cfg": {"y": 2}}
+
+
+_action_calls = []
+
+
+def _record_step(x: int):
+    _action_calls.append(x)
+
+
+def _failing_step(x: int):
+    raise ValueError("step failed")
+
+
+def _nested_step(x: int):
+    from src.blender_mcp.server import template_tools
+    data = {"actions": [{"tool": "_record_step", "params": {"x": x}, "parallel": True}] * 2}
+    template_tools._run_actions(template_tools._resolve_actions("nested", data, cache=False))
+
+
+class TestTemplateActions:
+    """Test grouping and running of template actions."""
+
+    def setup_method(self):
+        """Register the test tools once and reset recorded calls."""
+        from src.blender_mcp.server import template_tools
+        self.tools = template_tools
+        for fn in (_record_step, _failing_step, _nested_step):
+            if template_tools.mcp._tool_manager.get_tool(fn.__name__) is None:
+                template_tools.mcp.add_tool(fn)
+        _action_calls.clear()
+
+    def test_parallel_steps_are_grouped(self):
+        """Test only consecutive parallel steps share a batch."""
+        data = {"actions": [
+            {"tool": "_record_step", "params": {"x": 1}, "parallel": True},
+            {"tool": "_record_step", "params": {"x": 2}, "parallel": True},
+            {"tool": "_record_step", "params": {"x": 3}},
+            {"tool": "_record_step", "params": {"x": 4}, "parallel": True},
+        ]}
+        batches = self.tools._resolve_actions("grouping", data, cache=False)
+
+        assert [[params["x"] for _, _, params in batch] for batch in batches] == [[1, 2], [3], [4]]
+        self.tools._run_actions(batches)
+        assert sorted(_action_calls) == [1, 2, 3, 4]
+
+    def test_parallel_failure_stops_template(self):
+        """Test the first failing parallel step is raised and later steps are skipped."""
+        from mcp.server.fastmcp.exceptions import ToolError
+        data = {"actions": [
+            {"tool": "_failing_step", "params": {"x": 1}, "parallel": True},
+            {"tool": "_record_step", "params": {"x": 2}, "parallel": True},
+            {"tool": "_record_step", "params": {"x": 3}},
+        ]}
+        batches = self.tools._resolve_actions("failing", data, cache=False)
+
+        with pytest.raises(ToolError, match="_failing_step"):
+            self.tools._run_actions(batches)
+        assert 3 not in _action_calls
+
+    def test_nested_parallel_batches_do_not_deadlock(self):
+        """Test parallel steps that run parallel batches themselves finish with every worker busy."""
+        data = {"actions": [{"tool": "_nested_step", "params": {"x": i}, "parallel": True} for i in range(8)]}
+        batches = self.tools._resolve_actions("outer", data, cache=False)
+
+        runner = threading.Thread(target=self.tools._run_actions, args=(batches,), daemon=True)
+        runner.start()
+        runner.join(timeout=10)
+
+        assert not runner.is_alive()
+        assert sorted(_action_calls) == sorted(list(range(8)) * 2)
+
+    def test_unknown_tool_is_rejected_on_create(self):
+        """Test templates referencing unregistered tools are not saved."""
+        from mcp.server.fastmcp.exceptions import ToolError
+        with pytest.raises(ToolError, match="Unknown tool 'no_such_tool'"):
+            self.tools.create_template("unknown_tool", {"actions": [{"tool": "no_such_tool", "params": {}}]})
+
+    def test_step_arguments_are_validated(self):
+        """Test step params are validated against the tool's signature before it runs."""
+        from mcp.server.fastmcp.exceptions import ToolError
+        data = {"actions": [{"tool": "_record_step", "params": {"x": "not a number"}}]}
+        batches = self.tools._resolve_actions("bad_args", data, cache=False)
+
+        with pytest.raises(ToolError, match="_record_step"):
+            self.tools._run_actions(batches)
+        assert _action_calls == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file